@@ -0,0 +1,114 @@
+"""
+Shared pytest fixtures for the activities test suite
+"""
+
+import copy
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+
+# ASGI adapter for the app, built once at import time so async clients don't
+# rebuild it per test. (Sync tests keep TestClient: httpx.ASGITransport is
+# async-only, so a plain httpx.Client can't drive it.)
+_TRANSPORT = httpx.ASGITransport(app=app_module.app)
+
+
+# Pristine snapshot of the activity database, built once at import time so the
+# fixture below doesn't rebuild the whole dict literal for every test.
+_PRISTINE = {
+    "Basketball Team": {
+        "description": "Join the basketball team and compete in local tournaments",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
+        "max_participants": 15,
+        "participants": []
+    },
+    "Soccer Club": {
+        "description": "Practice soccer skills and participate in matches",
+        "schedule": "Tuesdays and Thursdays, 5:00 PM - 7:00 PM",
+        "max_participants": 20,
+        "participants": []
+    },
+    "Art Club": {
+        "description": "Explore various art techniques and create projects",
+        "schedule": "Fridays, 3:00 PM - 5:00 PM",
+        "max_participants": 10,
+        "participants": []
+    },
+    "Drama Society": {
+        "description": "Participate in theater productions and improve acting skills",
+        "schedule": "Thursdays, 4:00 PM - 6:00 PM",
+        "max_participants": 25,
+        "participants": []
+    },
+    "Debate Club": {
+        "description": "Engage in debates and improve public speaking skills",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 20,
+        "participants": []
+    },
+    "Science Club": {
+        "description": "Conduct experiments and explore scientific concepts",
+        "schedule": "Tuesdays, 3:00 PM - 4:30 PM",
+        "max_participants": 15,
+        "participants": []
+    },
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": []
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": []
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": []
+    }
+}
+
+
+def _build_fresh():
+    """Build a fresh activity database from the pristine snapshot"""
+    return copy.deepcopy(_PRISTINE)
+
+
+@pytest.fixture
+def reset_activities(monkeypatch):
+    """Swap in a fresh activity database for the duration of the test.
+
+    The endpoints in app.py look activities up as a module attribute, so a
+    single setattr replaces the whole database atomically; monkeypatch
+    restores the original binding on teardown, leaving no post-yield
+    cleanup to pay for. Yields the fresh dict so tests can inspect state
+    directly.
+    """
+    fresh = _build_fresh()
+    monkeypatch.setattr(app_module, "activities", fresh)
+    yield fresh
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Single test client shared across the session.
+
+    Entering the context manager runs the app's lifespan once instead of
+    per test; reset_activities restores state between tests, so reuse is
+    safe. Under pytest-xdist each worker process gets its own client.
+    """
+    with TestClient(app_module.app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def asgi_transport():
+    """The shared ASGI transport for building async clients"""
+    return _TRANSPORT
@@ -2,96 +2,38 @@
 Tests for the FastAPI activities application
 """
 
+import asyncio
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
-
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from app import app
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture
-def reset_activities():
-    """Reset activities to a clean state before each test"""
-    # Store original state
-    original_activities = {
-        "Basketball Team": {
-            "description": "Join the basketball team and compete in local tournaments",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
-            "max_participants": 15,
-            "participants": []
-        },
-        "Soccer Club": {
-            "description": "Practice soccer skills and participate in matches",
-            "schedule": "Tuesdays and Thursdays, 5:00 PM - 7:00 PM",
-            "max_participants": 20,
-            "participants": []
-        },
-        "Art Club": {
-            "description": "Explore various art techniques and create projects",
-            "schedule": "Fridays, 3:00 PM - 5:00 PM",
-            "max_participants": 10,
-            "participants": []
-        },
-        "Drama Society": {
-            "description": "Participate in theater productions and improve acting skills",
-            "schedule": "Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 25,
-            "participants": []
-        },
-        "Debate Club": {
-            "description": "Engage in debates and improve public speaking skills",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": []
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore scientific concepts",
-            "schedule": "Tuesdays, 3:00 PM - 4:30 PM",
-            "max_participants": 15,
-            "participants": []
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": []
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": []
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": []
-        }
-    }
-    
-    # Import activities from app module
-    from app import activities
-    
-    # Clear and reset
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Cleanup after test
-    activities.clear()
-    activities.update(original_activities)
+from urllib.parse import quote
+
+import app as app_module
+
+
+def signup_url(name):
+    """Build the URL-encoded signup path for an activity"""
+    return f"/activities/{quote(name)}/signup"
+
+
+def unregister_url(name):
+    """Build the URL-encoded unregister path for an activity"""
+    return f"/activities/{quote(name)}/unregister"
+
+
+# Most tests target Basketball Team, so build those paths once
+BBALL_SIGNUP = signup_url("Basketball Team")
+BBALL_UNREG = unregister_url("Basketball Team")
+
+
+def bulk_signup(activity, emails):
+    """Register students by mutating in-process state directly.
+
+    Used where signups are incidental setup, so tests skip the per-request
+    ASGI overhead; the signup endpoint itself is covered by
+    TestSignupForActivity.
+    """
+    app_module.activities[activity]["participants"].extend(emails)
 
 
 class TestGetActivities:
@@ -119,16 +61,17 @@ class TestGetActivities:
         assert "schedule" in activity
         assert "max_participants" in activity
         assert "participants" in activity
-        assert isinstance(activity["participants"], list)
     
     def test_get_activities_returns_participants(self, client, reset_activities):
         """Test that activities with participants return them"""
+        bulk_signup("Chess Club", ["michael@mergington.edu"])
+        bulk_signup("Programming Class", ["emma@mergington.edu"])
+
         response = client.get("/activities")
         data = response.json()
-        
-        # Check activities that have pre-populated participants
-        assert isinstance(data["Chess Club"]["participants"], list)
-        assert isinstance(data["Programming Class"]["participants"], list)
+
+        assert "michael@mergington.edu" in data["Chess Club"]["participants"]
+        assert "emma@mergington.edu" in data["Programming Class"]["participants"]
 
 
 class TestSignupForActivity:
@@ -137,7 +80,7 @@ class TestSignupForActivity:
     def test_signup_success(self, client, reset_activities):
         """Test successful signup for an activity"""
         response = client.post(
-            "/activities/Basketball%20Team/signup",
+            BBALL_SIGNUP,
             params={"email": "student@mergington.edu"}
         )
         assert response.status_code == 200
@@ -151,64 +94,42 @@ class TestSignupForActivity:
         
         # Sign up
         client.post(
-            "/activities/Basketball%20Team/signup",
-            params={"email": email}
-        )
-        
-        # Verify participant was added
-        response = client.get("/activities")
-        data = response.json()
-        assert email in data["Basketball Team"]["participants"]
-    
-    def test_signup_nonexistent_activity_returns_404(self, client, reset_activities):
-        """Test that signup for non-existent activity returns 404"""
-        response = client.post(
-            "/activities/Nonexistent%20Activity/signup",
-            params={"email": "student@mergington.edu"}
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
-    
-    def test_signup_duplicate_participant_returns_400(self, client, reset_activities):
-        """Test that duplicate signup returns 400"""
-        email = "student@mergington.edu"
-        
-        # First signup
-        response1 = client.post(
-            "/activities/Basketball%20Team/signup",
+            BBALL_SIGNUP,
             params={"email": email}
         )
-        assert response1.status_code == 200
         
-        # Duplicate signup
-        response2 = client.post(
-            "/activities/Basketball%20Team/signup",
-            params={"email": email}
-        )
-        assert response2.status_code == 400
-        assert "already signed up" in response2.json()["detail"]
+        # Verify participant was added (read in-process state directly;
+        # serialization is covered by TestGetActivities)
+        assert email in app_module.activities["Basketball Team"]["participants"]
     
-    def test_signup_multiple_students(self, client, reset_activities):
-        """Test that multiple students can sign up"""
+    @pytest.mark.asyncio
+    async def test_signup_multiple_students(self, reset_activities,
+                                            asgi_transport):
+        """Test that multiple students can sign up concurrently"""
         emails = [
             "student1@mergington.edu",
             "student2@mergington.edu",
             "student3@mergington.edu"
         ]
-        
-        for email in emails:
-            response = client.post(
-                "/activities/Basketball%20Team/signup",
-                params={"email": email}
+
+        # Issue the signups concurrently against the in-process app; the
+        # emails are distinct, so the requests are independent
+        async with httpx.AsyncClient(
+            transport=asgi_transport,
+            base_url="http://testserver"
+        ) as ac:
+            responses = await asyncio.gather(
+                *[ac.post(BBALL_SIGNUP, params={"email": email})
+                  for email in emails]
             )
+        for response in responses:
             assert response.status_code == 200
-        
+
         # Verify all were added
-        response = client.get("/activities")
-        data = response.json()
+        participants = app_module.activities["Basketball Team"]["participants"]
         for email in emails:
-            assert email in data["Basketball Team"]["participants"]
-        assert len(data["Basketball Team"]["participants"]) == 3
+            assert email in participants
+        assert len(participants) == 3
 
 
 class TestUnregisterFromActivity:
@@ -217,16 +138,13 @@ class TestUnregisterFromActivity:
     def test_unregister_success(self, client, reset_activities):
         """Test successful unregister from an activity"""
         email = "student@mergington.edu"
-        
+
         # Sign up first
-        client.post(
-            "/activities/Basketball%20Team/signup",
-            params={"email": email}
-        )
-        
+        bulk_signup("Basketball Team", [email])
+
         # Unregister
         response = client.delete(
-            "/activities/Basketball%20Team/unregister",
+            BBALL_UNREG,
             params={"email": email}
         )
         assert response.status_code == 200
@@ -237,41 +155,18 @@ class TestUnregisterFromActivity:
     def test_unregister_removes_participant(self, client, reset_activities):
         """Test that unregister actually removes the participant"""
         email = "student@mergington.edu"
-        
+
         # Sign up
-        client.post(
-            "/activities/Basketball%20Team/signup",
-            params={"email": email}
-        )
-        
+        bulk_signup("Basketball Team", [email])
+
         # Unregister
         client.delete(
-            "/activities/Basketball%20Team/unregister",
+            BBALL_UNREG,
             params={"email": email}
         )
         
         # Verify participant was removed
-        response = client.get("/activities")
-        data = response.json()
-        assert email not in data["Basketball Team"]["participants"]
-    
-    def test_unregister_nonexistent_activity_returns_404(self, client, reset_activities):
-        """Test that unregister from non-existent activity returns 404"""
-        response = client.delete(
-            "/activities/Nonexistent%20Activity/unregister",
-            params={"email": "student@mergington.edu"}
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
-    
-    def test_unregister_not_signed_up_returns_400(self, client, reset_activities):
-        """Test that unregister for non-participant returns 400"""
-        response = client.delete(
-            "/activities/Basketball%20Team/unregister",
-            params={"email": "student@mergington.edu"}
-        )
-        assert response.status_code == 400
-        assert "not signed up" in response.json()["detail"]
+        assert email not in app_module.activities["Basketball Team"]["participants"]
     
     def test_unregister_one_of_multiple(self, client, reset_activities):
         """Test unregistering one student when multiple are signed up"""
@@ -282,25 +177,51 @@ class TestUnregisterFromActivity:
         ]
         
         # Sign up all
-        for email in emails:
-            client.post(
-                "/activities/Basketball%20Team/signup",
-                params={"email": email}
-            )
-        
+        bulk_signup("Basketball Team", emails)
+
         # Unregister one
         client.delete(
-            "/activities/Basketball%20Team/unregister",
+            BBALL_UNREG,
             params={"email": emails[1]}
         )
         
         # Verify only that one was removed
-        response = client.get("/activities")
-        data = response.json()
-        assert emails[0] in data["Basketball Team"]["participants"]
-        assert emails[1] not in data["Basketball Team"]["participants"]
-        assert emails[2] in data["Basketball Team"]["participants"]
-        assert len(data["Basketball Team"]["participants"]) == 2
+        participants = app_module.activities["Basketball Team"]["participants"]
+        assert emails[0] in participants
+        assert emails[1] not in participants
+        assert emails[2] in participants
+        assert len(participants) == 2
+
+
+class TestErrorResponses:
+    """Tests for the signup and unregister error paths"""
+
+    @pytest.mark.parametrize("method,path,email,status,detail", [
+        ("POST", "/activities/Nonexistent%20Activity/signup",
+         "student@mergington.edu", 404, "Activity not found"),
+        ("DELETE", "/activities/Nonexistent%20Activity/unregister",
+         "student@mergington.edu", 404, "Activity not found"),
+        ("POST", BBALL_SIGNUP,
+         "existing@mergington.edu", 400, "already signed up"),
+        ("DELETE", BBALL_UNREG,
+         "student@mergington.edu", 400, "not signed up"),
+    ], ids=[
+        "signup-nonexistent-activity",
+        "unregister-nonexistent-activity",
+        "signup-duplicate-participant",
+        "unregister-not-signed-up",
+    ])
+    def test_error_response(self, client, reset_activities,
+                            method, path, email, status, detail):
+        """Test that invalid signups and unregisters return the right error"""
+        # Pre-seed one participant so the duplicate-signup case has a
+        # conflict; the other cases use a different email or activity
+        app_module.activities["Basketball Team"]["participants"].append(
+            "existing@mergington.edu")
+
+        response = client.request(method, path, params={"email": email})
+        assert response.status_code == status
+        assert detail in response.json()["detail"]
 
 
 class TestIntegration:
@@ -312,27 +233,24 @@ class TestIntegration:
         activity = "Basketball Team"
         
         # Verify initially not signed up
-        response = client.get("/activities")
-        assert email not in response.json()[activity]["participants"]
-        
+        assert email not in app_module.activities[activity]["participants"]
+
         # Sign up
         response = client.post(
-            f"/activities/{activity.replace(' ', '%20')}/signup",
+            signup_url(activity),
             params={"email": email}
         )
         assert response.status_code == 200
-        
+
         # Verify signed up
-        response = client.get("/activities")
-        assert email in response.json()[activity]["participants"]
-        
+        assert email in app_module.activities[activity]["participants"]
+
         # Unregister
         response = client.delete(
-            f"/activities/{activity.replace(' ', '%20')}/unregister",
+            unregister_url(activity),
             params={"email": email}
         )
         assert response.status_code == 200
-        
+
         # Verify unregistered
-        response = client.get("/activities")
-        assert email not in response.json()[activity]["participants"]
+        assert email not in app_module.activities[activity]["participants"]